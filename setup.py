@@ -38,5 +38,11 @@ setup(
             "black==21.12b0",
             "pytest",
         ],
+        "fast": [
+            "orjson",
+        ],
+        "cache": [
+            "pyarrow",
+        ],
     }
 )
\ No newline at end of file
@@ -1,5 +1,6 @@
 from typing import Optional
 from notion_df import upload, download
+from notion_df.constants import NOTION_DEFAULT_CONCURRENCY
 
 
 def read_notion(
@@ -8,6 +9,7 @@ def read_notion(
     resolve_relation_values: bool = False,
     errors: str = "strict",
     api_key: str = None,
+    use_cache: bool = False,
 ) -> "pd.DataFrame":
     """Download a Notion database as a pandas DataFrame.
 
@@ -33,6 +35,11 @@ def read_notion(
         api_key (str, optional):
             The API key of the Notion integration.
             Defaults to None.
+        use_cache (bool, optional):
+            If True, the downloaded database is saved on disk, and it is
+            loaded from disk as long as the `last_edited_time` of the
+            Notion database has not changed. It requires pyarrow.
+            Defaults to False.
     Returns:
         pd.DataFrame: the loaded dataframe.
     """
@@ -41,6 +48,7 @@ def read_notion(
         nrows=nrows,
         resolve_relation_values=resolve_relation_values,
         errors=errors,
+        use_cache=use_cache,
         api_key=api_key,
     )
 
@@ -57,6 +65,8 @@ def to_notion(
     create_new_rows_in_relation_target: bool = False,
     return_response: bool = False,
     api_key: str = None,
+    concurrency: int = NOTION_DEFAULT_CONCURRENCY,
+    children_col: str = "",
 ):
 
     """Upload a dataframe to the specified Notion database.
@@ -111,6 +121,16 @@ def to_notion(
         api_key (str, optional):
             The API key of the Notion integration.
             Defaults to None.
+        concurrency (int, optional):
+            The maximum number of rows to be uploaded to Notion concurrently.
+            Rows may appear in a different order in the Notion database
+            when it is larger than 1. It must be at least 1.
+            Defaults to 8.
+        children_col (str, optional):
+            The column whose text values are uploaded as the content of the
+            created Notion pages rather than as a database property. Each
+            line of the text becomes a paragraph block.
+            Defaults to "".
     """
 
     return upload(
@@ -123,7 +143,9 @@ def to_notion(
         errors=errors,
         resolve_relation_values=resolve_relation_values,
         create_new_rows_in_relation_target=create_new_rows_in_relation_target,
+        children_col=children_col,
         return_response=return_response,
+        concurrency=concurrency,
         api_key=api_key,
     )
 
@@ -1,18 +1,38 @@
 from typing import List, Dict, Optional, Union, Tuple
 from datetime import datetime
 import warnings
+import asyncio
 import os
-from functools import wraps
+import re
+from functools import wraps, lru_cache
+from urllib.parse import urlparse, parse_qs
 
 import pandas as pd
-from httpx import HTTPStatusError
-from notion_client import Client
+from httpx import HTTPStatusError, TimeoutException
+from notion_client import Client, AsyncClient
+from notion_client.errors import HTTPResponseError, RequestTimeoutError
 from notion_client.helpers import get_id
 
 from notion_df.values import PageProperties, PageProperty
 from notion_df.configs import DatabaseSchema, NON_EDITABLE_TYPES
-from notion_df.utils import is_uuid, flatten_dict
-from notion_df.blocks import parse_blocks, BaseNotionBlock
+from notion_df.utils import (
+    is_uuid,
+    is_item_empty,
+    UUID_REGEX,
+    flatten_dict,
+    run_async,
+    request_with_retry,
+    json_dumps,
+    create_http_client,
+    create_async_client,
+)
+from notion_df.constants import (
+    NOTION_DEFAULT_CONCURRENCY,
+    NOTION_CREATE_RETRYABLE_STATUS,
+    BLOCK_CHILDREN_MAX_LENGTH,
+)
+from notion_df.blocks import parse_blocks, BaseNotionBlock, ParagraphBlock
+from notion_df.cache import load_cached_df, save_cached_df
 
 API_KEY = None
 NOT_REVERSE_DATAFRAME = -1
@@ -27,21 +47,36 @@ NOTION_MAX_PAGE_SIZE = 100
 def config(api_key: str):
     global API_KEY
     API_KEY = api_key
+    _resolve_default_api_key.cache_clear()
+
+
+@lru_cache(maxsize=1)
+def _resolve_default_api_key() -> Optional[str]:
+    # The NOTION_API_KEY environment variable is only read once
+    if API_KEY is not None:
+        return API_KEY
+    return os.environ.get("NOTION_API_KEY")
 
 
 def _load_api_key(api_key: str) -> str:
     if api_key is not None:
         return api_key
-    elif API_KEY is not None:
-        return API_KEY
-    elif os.environ.get("NOTION_API_KEY") is not None:
-        return os.environ.get("NOTION_API_KEY")
+
+    api_key = _resolve_default_api_key()
+    if api_key is not None:
+        return api_key
     else:
+        # Don't cache the missing key, so it can be set later
+        _resolve_default_api_key.cache_clear()
         raise ValueError("No API key provided")
 
 
 def _is_notion_database(notion_url):
-    return "?v=" in notion_url.split("/")[-1]
+    return "v" in parse_qs(urlparse(notion_url).query, keep_blank_values=True)
+
+
+def _create_client(api_key: str) -> Client:
+    return Client(auth=api_key, client=create_http_client())
 
 
 def use_client(func):
@@ -51,7 +86,7 @@ def use_client(func):
 
         if client is None:
             api_key = _load_api_key(kwargs.pop("api_key", None))
-            client = Client(auth=api_key)
+            client = _create_client(api_key)
         out = func(client=client, *args, **kwargs)
 
         if orig_client is None:
@@ -79,12 +114,31 @@ def query_database(
     return query_results
 
 
+async def _query_database_async(
+    database_id: str,
+    aclient: AsyncClient,
+    start_cursor: Optional[str] = None,
+    page_size: int = NOTION_DEFAULT_PAGE_SIZE,
+):
+    query_dict = {"database_id": database_id, "page_size": page_size}
+    if start_cursor is not None:
+        query_dict["start_cursor"] = start_cursor
+
+    query_results = await request_with_retry(aclient.databases.query, **query_dict)
+
+    assert query_results["object"] == "list"
+    return query_results
+
+
 def load_df_from_queries(
     database_query_results: List[Dict],
 ):
     properties = PageProperties.from_raw(database_query_results)
     df = properties.to_frame()
+    return _set_notion_attributes(df, database_query_results)
+
 
+def _set_notion_attributes(df: pd.DataFrame, database_query_results: List[Dict]):
     with warnings.catch_warnings():
         warnings.simplefilter("ignore")
         # TODO: figure out a better solution
@@ -106,29 +160,13 @@ def load_df_from_queries(
     return df
 
 
-def download_df_from_database(
+async def _download_df_from_database_async(
     notion_url: str,
-    client: Client,
+    aclient: AsyncClient,
     nrows: Optional[int] = None,
     errors: str = "strict",
+    use_cache: bool = False,
 ) -> pd.DataFrame:
-    """Download a Notion database as a pandas DataFrame.
-
-    Args:
-        notion_url (str):
-            The URL of the Notion database to download from.
-        nrows (int, optional):
-            Number of rows of file to read. Useful for reading
-            pieces of large files.
-        api_key (str, optional):
-            The API key of the Notion integration.
-            Defaults to None.
-        client (Client, optional):
-            The notion client.
-            Defaults to None.
-    Returns:
-        pd.DataFrame: the loaded dataframe.
-    """
     if not is_uuid(notion_url):
         assert _is_notion_database(notion_url)
         database_id = get_id(notion_url)
@@ -137,9 +175,11 @@ def download_df_from_database(
 
     # Check the if the id is a database first
     try:
-        retrieve_results = client.databases.retrieve(database_id=database_id)
+        retrieve_results = await request_with_retry(
+            aclient.databases.retrieve, database_id=database_id
+        )
         schema = DatabaseSchema.from_raw(retrieve_results["properties"])
-    except HTTPStatusError:
+    except (HTTPStatusError, HTTPResponseError):
         error_msg = (
             f"The object {database_id} might not be a notion database, "
             "or integration associated with the API key don't have access "
@@ -153,6 +193,13 @@ def download_df_from_database(
         elif errors == "ignore":
             return None
 
+    if use_cache:
+        last_edited_time = retrieve_results["last_edited_time"]
+        cached = load_cached_df(database_id, last_edited_time, nrows)
+        if cached is not None:
+            df = _set_notion_attributes(*cached)
+            return schema.create_df(df)
+
     downloaded_rows = []
 
     page_size = NOTION_MAX_PAGE_SIZE
@@ -160,9 +207,13 @@ def download_df_from_database(
         if nrows <= NOTION_MAX_PAGE_SIZE:
             page_size = nrows
 
-    query_results = query_database(database_id, client, page_size=page_size)
+    query_results = await _query_database_async(
+        database_id, aclient, page_size=page_size
+    )
     downloaded_rows.extend(query_results["results"])
 
+    # Notion returns the cursor of the next page with the current page,
+    # so the pages of one database have to be fetched one after another.
     while query_results["has_more"]:
         if nrows is not None:
             if len(downloaded_rows) >= nrows:
@@ -172,9 +223,9 @@ def download_df_from_database(
         else:
             page_size = NOTION_MAX_PAGE_SIZE
 
-        query_results = query_database(
+        query_results = await _query_database_async(
             database_id,
-            client,
+            aclient,
             start_cursor=query_results["next_cursor"],
             page_size=page_size,
         )
@@ -182,15 +233,93 @@ def download_df_from_database(
 
     df = load_df_from_queries(downloaded_rows)
     df = schema.create_df(df)
+    if use_cache:
+        save_cached_df(df, downloaded_rows, database_id, last_edited_time, nrows)
     return df
 
 
+async def _download_dfs_from_databases_async(
+    notion_urls: List[str],
+    client: Client,
+    nrows: Optional[int] = None,
+    errors: str = "strict",
+    use_cache: bool = False,
+) -> List[pd.DataFrame]:
+    aclient = create_async_client(client)
+    try:
+        return await asyncio.gather(
+            *[
+                _download_df_from_database_async(
+                    notion_url, aclient, nrows, errors, use_cache
+                )
+                for notion_url in notion_urls
+            ]
+        )
+    finally:
+        await aclient.aclose()
+
+
+def download_dfs_from_databases(
+    notion_urls: List[str],
+    client: Client,
+    nrows: Optional[int] = None,
+    errors: str = "strict",
+    use_cache: bool = False,
+) -> List[pd.DataFrame]:
+    """Download multiple Notion databases concurrently. See
+    `download_df_from_database` for the arguments."""
+    return run_async(
+        _download_dfs_from_databases_async(
+            notion_urls, client, nrows, errors, use_cache
+        )
+    )
+
+
+def download_df_from_database(
+    notion_url: str,
+    client: Client,
+    nrows: Optional[int] = None,
+    errors: str = "strict",
+    use_cache: bool = False,
+) -> pd.DataFrame:
+    """Download a Notion database as a pandas DataFrame.
+
+    Args:
+        notion_url (str):
+            The URL of the Notion database to download from.
+        nrows (int, optional):
+            Number of rows of file to read. Useful for reading
+            pieces of large files.
+        use_cache (bool, optional):
+            If True, the downloaded database is saved on disk, and it is
+            loaded from disk as long as the `last_edited_time` of the
+            Notion database has not changed.
+            Defaults to False.
+        api_key (str, optional):
+            The API key of the Notion integration.
+            Defaults to None.
+        client (Client, optional):
+            The notion client. The rows are downloaded concurrently through a
+            separate connection pool with the same options (auth, base url,
+            timeout), which does not reuse the transport of the httpx client
+            inside; set proxies and TLS through the environment variables
+            (e.g., HTTPS_PROXY and SSL_CERT_FILE) instead.
+            Defaults to None.
+    Returns:
+        pd.DataFrame: the loaded dataframe.
+    """
+    return download_dfs_from_databases(
+        [notion_url], client, nrows, errors, use_cache
+    )[0]
+
+
 @use_client
 def download(
     notion_url: str,
     nrows: Optional[int] = None,
     resolve_relation_values: Optional[bool] = False,
     errors: str = "strict",
+    use_cache: bool = False,
     *,
     api_key: str = None,
     client: Client = None,
@@ -200,26 +329,30 @@ def download(
         nrows=nrows,
         client=client,
         errors=errors,
+        use_cache=use_cache,
     )
     if resolve_relation_values:
-        for col in df.columns:
-            if df.schema[col].type == "relation":
-                relation_df = download_df_from_database(
-                    df.schema[col].relation.database_id,
-                    errors="warn",
-                    client=client,
-                )
-                if relation_df is not None:
-                    rel_title_col = relation_df.schema.title_column
-                    obj_id_to_string = {
-                        obj_id: obj_title
-                        for obj_id, obj_title in zip(
-                            relation_df.notion_ids, relation_df[rel_title_col]
-                        )
-                    }
-                    df[col] = df[col].apply(
-                        lambda row: [obj_id_to_string[ele] for ele in row]
+        relation_cols = [
+            col for col in df.columns if df.schema[col].type == "relation"
+        ]
+        relation_dfs = download_dfs_from_databases(
+            [df.schema[col].relation.database_id for col in relation_cols],
+            errors="warn",
+            use_cache=use_cache,
+            client=client,
+        )
+        for col, relation_df in zip(relation_cols, relation_dfs):
+            if relation_df is not None:
+                rel_title_col = relation_df.schema.title_column
+                obj_id_to_string = {
+                    obj_id: obj_title
+                    for obj_id, obj_title in zip(
+                        relation_df.notion_ids, relation_df[rel_title_col]
                     )
+                }
+                df[col] = df[col].apply(
+                    lambda row: [obj_id_to_string[ele] for ele in row]
+                )
     return df
 
 
@@ -235,45 +368,166 @@ def create_database(
     return response
 
 
-def upload_row_to_database(row, database_id, schema, children, client) -> Dict:
-
-    properties = PageProperty.from_series(row, schema).query_dict()
+class UploadResponses(list):
+    """The Notion responses of the uploaded rows. The rows that failed to
+    upload are stored in `failures` as a list of (row position, exception)
+    tuples."""
+
+    def __init__(self, responses: List[Dict], failures: List[Tuple[int, Exception]]):
+        super().__init__(responses)
+        self.failures = failures
+
+
+def _prepare_page_payload(
+    properties, database_id, children
+) -> Tuple[Dict, List[List[Dict]]]:
+    """Create the payload for creating the page. As Notion accepts at most
+    BLOCK_CHILDREN_MAX_LENGTH children in a request, the children beyond
+    the limit are returned in batches, to be appended after the page is
+    created."""
+    if isinstance(properties, Exception):
+        # The row failed to be converted when building the columns
+        raise properties
+    payload = {"parent": {"database_id": database_id}, "properties": properties}
+    children_batches = []
     if children:
         if not isinstance(children, list):
             children = [children]
-        for cid in range(len(children)):
-            if isinstance(children[cid], BaseNotionBlock):
-                children[cid] = flatten_dict(children[cid].dict())
-                
-        response = client.pages.create(
-            parent={"database_id": database_id}, properties=properties, children=children
+        children = [
+            flatten_dict(child.dict()) if isinstance(child, BaseNotionBlock) else child
+            for child in children
+        ]
+        children_batches = [
+            children[idx : idx + BLOCK_CHILDREN_MAX_LENGTH]
+            for idx in range(0, len(children), BLOCK_CHILDREN_MAX_LENGTH)
+        ]
+        payload["children"] = children_batches.pop(0)
+    return payload, children_batches
+
+
+def upload_row_to_database(row, database_id, schema, children, client) -> Dict:
+    properties = PageProperty.query_dicts_from_columns(
+        [(key, [value]) for key, value in row.items()],
+        schema.compiled_column_builders,
+    )[0]
+    payload, children_batches = _prepare_page_payload(properties, database_id, children)
+    response = client.pages.create(**payload)
+    for children_batch in children_batches:
+        client.blocks.children.append(block_id=response["id"], children=children_batch)
+    return response
+
+
+async def _create_page_fast(aclient: AsyncClient, body: Dict) -> Dict:
+    # Send the encoded body directly rather than through aclient.pages.create,
+    # such that it can be encoded by the faster json_dumps. Timeouts are
+    # raised as RequestTimeoutError as in aclient.request.
+    try:
+        response = await aclient.client.post(
+            "pages",
+            content=json_dumps(body),
+            headers={"Content-Type": "application/json"},
         )
-    else:
-        response = client.pages.create(
-            parent={"database_id": database_id}, properties=properties,
+    except TimeoutException:
+        raise RequestTimeoutError()
+    return aclient._parse_response(response)
+
+
+async def _upload_row_async(properties, database_id, children, aclient) -> Dict:
+    payload, children_batches = _prepare_page_payload(properties, database_id, children)
+    response = await request_with_retry(
+        _create_page_fast,
+        aclient,
+        payload,
+        retryable_status=NOTION_CREATE_RETRYABLE_STATUS,
+    )
+    for children_batch in children_batches:
+        await request_with_retry(
+            aclient.blocks.children.append,
+            block_id=response["id"],
+            children=children_batch,
+            retryable_status=NOTION_CREATE_RETRYABLE_STATUS,
         )
     return response
 
 
-def upload_to_database(df, databse_id, schema, client, errors, children) -> List[Dict]:
-    all_response = []
+async def _upload_to_database_async(
+    df, databse_id, schema, client, errors, children, concurrency
+) -> UploadResponses:
     if children is not None:
         assert len(children) == len(df)
         children = children[::NOT_REVERSE_DATAFRAME]
+    # Build the page properties column by column rather than row by row
+    all_properties = PageProperty.query_dicts_from_df(
+        df.iloc[::NOT_REVERSE_DATAFRAME], schema.compiled_column_builders
+    )
 
-    for idx, (_, row) in enumerate(df[::NOT_REVERSE_DATAFRAME].iterrows(), ):
-        try:
+    semaphore = asyncio.Semaphore(concurrency)
+    aclient = create_async_client(client)
+
+    async def _upload(idx, properties):
+        async with semaphore:
             child = children[idx] if children is not None else None
-            response = upload_row_to_database(row, databse_id, schema, child, client)
-            all_response.append(response)
-        except Exception as e:
-            if errors == "strict":
-                raise e
-            elif errors == "warn":
-                warnings.warn(f"Encountered errors {e} while uploading row: {row}")
-            elif errors == "ignore":
-                continue
-    return all_response[::NOT_REVERSE_DATAFRAME]
+            return await _upload_row_async(properties, databse_id, child, aclient)
+
+    tasks = [
+        asyncio.create_task(_upload(idx, properties))
+        for idx, properties in enumerate(all_properties)
+    ]
+    try:
+        results = await asyncio.gather(*tasks, return_exceptions=errors != "strict")
+    except Exception as e:
+        # Stop uploading the remaining rows when errors == "strict"
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise e
+    finally:
+        await aclient.aclose()
+
+    all_response = []
+    failures = []
+    positions = list(range(len(df)))[::NOT_REVERSE_DATAFRAME]
+    for position, result in zip(positions, results):
+        if isinstance(result, Exception):
+            failures.append((position, result))
+        else:
+            all_response.append(result)
+    failures = failures[::NOT_REVERSE_DATAFRAME]
+
+    if failures and errors == "warn":
+        # Summarize the failures in a single warning
+        warnings.warn(
+            f"{len(failures)} rows failed to upload: "
+            f"indices={[position for position, _ in failures]}; "
+            f"first error={failures[0][1]!r}"
+        )
+    return UploadResponses(all_response[::NOT_REVERSE_DATAFRAME], failures)
+
+
+def upload_to_database(
+    df,
+    databse_id,
+    schema,
+    client,
+    errors,
+    children=None,
+    concurrency=NOTION_DEFAULT_CONCURRENCY,
+) -> UploadResponses:
+    return run_async(
+        _upload_to_database_async(
+            df, databse_id, schema, client, errors, children, concurrency
+        )
+    )
+
+
+def _children_from_column(column: pd.Series) -> List[List[BaseNotionBlock]]:
+    # Each line of the text becomes a paragraph block of the page
+    return [
+        []
+        if is_item_empty(text)
+        else [ParagraphBlock.from_value(line) for line in str(text).splitlines()]
+        for text in column
+    ]
 
 
 def load_database_schema(database_id, client):
@@ -295,6 +549,8 @@ def upload(
     create_new_rows_in_relation_target: bool = False,
     children: List[Union[Dict, BaseNotionBlock]] = None,
     return_response: bool = False,
+    concurrency: int = NOTION_DEFAULT_CONCURRENCY,
+    children_col: str = "",
     *,
     api_key: str = None,
     client: Client = None,
@@ -350,18 +606,43 @@ def upload(
             Defaults to False.
         return_response (bool, optional):
             If True, then the function will return a list of responses for
-            the updates from Notion.
+            the updates from Notion. The rows that failed to upload are
+            listed in its `failures` attribute.
+        concurrency (int, optional):
+            The maximum number of rows to be uploaded to Notion concurrently.
+            Rows may appear in a different order in the Notion database
+            when it is larger than 1. It must be at least 1.
+            Defaults to 8.
+        children_col (str, optional):
+            The column whose text values are uploaded as the content of the
+            created Notion pages rather than as a database property. Each
+            line of the text becomes a paragraph block. It cannot be used
+            together with `children`.
+            Defaults to "".
         api_key (str, optional):
             The API key of the Notion integration.
             Defaults to None.
         client (Client, optional):
-            The notion client.
+            The notion client. The rows are uploaded concurrently through a
+            separate connection pool with the same options (auth, base url,
+            timeout), which does not reuse the transport of the httpx client
+            inside; set proxies and TLS through the environment variables
+            (e.g., HTTPS_PROXY and SSL_CERT_FILE) instead.
             Defaults to None.
     """
+    if concurrency < 1:
+        raise ValueError(f"`concurrency` must be at least 1, got {concurrency}.")
+
     if schema is None:
         if hasattr(df, "schema"):
             schema = df.schema
 
+    if children_col:
+        if children is not None:
+            raise ValueError("`children` and `children_col` cannot be set together.")
+        children = _children_from_column(df[children_col])
+        df = df.drop(columns=children_col)
+
     if not _is_notion_database(notion_url):
         if schema is None:
             schema = DatabaseSchema.from_df(df, title_col=title_col)
@@ -394,7 +675,8 @@ def upload(
         for col in df.columns:
             if schema[col].type == "relation":
                 
-                if df[col].apply(lambda row: all([is_uuid(ele) for ele in row])).all():
+                relation_ids = df[col].explode().dropna().astype(str)
+                if relation_ids.str.fullmatch(UUID_REGEX, flags=re.IGNORECASE).all():
                     # The column is all in uuid, we don't need to resolve it 
                     continue 
 
@@ -436,6 +718,7 @@ def upload(
                             relation_df.schema,
                             client,
                             "warn",
+                            concurrency=concurrency,
                         )
                         appended_relation_df = load_df_from_queries(responses)
                         obj_string_to_id.update(
@@ -452,7 +735,9 @@ def upload(
                         lambda row: [obj_string_to_id[ele] for ele in row if ele in obj_string_to_id]
                     )
 
-    response = upload_to_database(df, databse_id, schema, client, errors, children)
+    response = upload_to_database(
+        df, databse_id, schema, client, errors, children, concurrency
+    )
 
     print(f"Your dataframe has been uploaded to the Notion page: {notion_url} .")
     if return_response:
@@ -1,11 +1,17 @@
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Literal
 from enum import Enum
+import os
 from pydantic import field_validator, BaseModel, root_validator
 import pandas as pd
 
-from notion_df.utils import is_time_string, is_uuid
+from notion_df.utils import is_time_string, is_uuid, split_string
 from notion_df.constants import RICH_TEXT_CONTENT_MAX_LENGTH
 
+SKIP_DATE_VALIDATION = os.environ.get("NOTION_DF_SKIP_DATE_VALIDATE") == "1"
+# Set NOTION_DF_SKIP_DATE_VALIDATE=1 to skip parsing every date string in
+# DateObject. The date columns are already parsed and formatted when
+# transforming the dataframe with the schema.
+
 ### All colors supported in NOTION
 
 
@@ -44,6 +50,11 @@ class NotionExtendedColorEnum(str, Enum):
     RedBackground = "red_background"
 
 
+NotionExtendedColor = Literal[tuple(color.value for color in NotionExtendedColorEnum)]
+# pydantic validates Literal fields with a set lookup in pydantic-core,
+# which is much cheaper than the validation for Enum fields.
+
+
 class RichTextTypeEnum(str, Enum):
     Text = "text"
     Mention = "mention"
@@ -100,7 +111,7 @@ class UserObject(BaseModel):
 
     @classmethod
     def from_value(cls, value: str):
-        return cls(id=value)
+        return cls.model_construct(id=value)
 
     @field_validator("object")
     @classmethod
@@ -138,7 +149,7 @@ class DateObject(BaseModel):
     @classmethod
     def is_start_ISO8601(cls, v):
         # TODO: Currently it cannot suport time ranges
-        if v is not None:
+        if v is not None and not SKIP_DATE_VALIDATION:
             if not is_time_string(v):
                 raise ValueError(
                     "The data start is not appropriately formatted as an ISO 8601 date string."
@@ -148,7 +159,7 @@ class DateObject(BaseModel):
     @field_validator("end")
     @classmethod
     def is_end_ISO8601(cls, v):
-        if v is not None:
+        if v is not None and not SKIP_DATE_VALIDATION:
             if not is_time_string(v):
                 raise ValueError(
                     "The data end is not appropriately formatted as an ISO 8601 date string."
@@ -263,7 +274,7 @@ class AnnotationObject(BaseModel):
     strikethrough: bool
     underline: bool
     code: bool
-    color: NotionExtendedColorEnum
+    color: NotionExtendedColor
 
 
 class TextLinkObject(BaseModel):
@@ -316,14 +327,14 @@ class RichTextObject(BaseRichTextObject):
 
     @classmethod
     def from_value(cls, value: str):
-        return cls(text=TextObject(content=value))
+        # The value is a known-valid string, so we skip the validation
+        return cls.model_construct(text=TextObject.model_construct(content=value))
 
     @classmethod
     def encode_string(cls, value: str) -> List["RichTextObject"]:
-        chunk_size = RICH_TEXT_CONTENT_MAX_LENGTH
         return [
-            cls(text=TextObject(content=value[idx : idx + chunk_size]))
-            for idx in range(0, len(value), chunk_size)
+            cls.from_value(chunk)
+            for chunk in split_string(value, RICH_TEXT_CONTENT_MAX_LENGTH)
         ]
 
 
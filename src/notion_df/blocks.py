@@ -1,8 +1,10 @@
 import warnings
+import asyncio
+from types import MappingProxyType
 from typing import List, Union, Dict, Any, Tuple, Optional, Union
 
-from notion_client import Client
-from pydantic import BaseModel, parse_obj_as, validator, root_validator
+from notion_client import Client, AsyncClient
+from pydantic import BaseModel, TypeAdapter, validator, root_validator
 
 from notion_df.base import (
     RichTextObject,
@@ -14,8 +16,10 @@ from notion_df.base import (
     FileObject,
     EmojiObject,
     FormulaObject,
-    NotionExtendedColorEnum,
+    NotionExtendedColor,
 )
+from notion_df.utils import run_async, request_with_retry, create_async_client
+from notion_df.constants import NOTION_DEFAULT_CONCURRENCY
 
 
 class ParentObject(BaseModel):
@@ -37,12 +41,12 @@ class BaseAttributeWithChildren(BaseModel):
 
 class TextBlockAttributes(BaseAttributeWithChildren):
     rich_text: List[RichTextObject]
-    color: Optional[NotionExtendedColorEnum] = None
+    color: Optional[NotionExtendedColor] = None
 
 
 class HeadingBlockAttributes(BaseAttributeWithChildren):
     rich_text: List[RichTextObject]
-    color: Optional[NotionExtendedColorEnum] = None
+    color: Optional[NotionExtendedColor] = None
     is_toggleable: bool
     # Whether or not the heading block is a toggle heading or not. If true, the heading block has toggle and can support children. If false, the heading block is a normal heading block.
 
@@ -50,12 +54,12 @@ class HeadingBlockAttributes(BaseAttributeWithChildren):
 class CalloutBlockAttributes(BaseAttributeWithChildren):
     rich_text: List[RichTextObject]
     icon: Optional[Union[FileObject, EmojiObject]] = None
-    color: Optional[NotionExtendedColorEnum] = None
+    color: Optional[NotionExtendedColor] = None
 
 
 class ToDoBlockAttributes(BaseAttributeWithChildren):
     rich_text: List[RichTextObject]
-    color: Optional[NotionExtendedColorEnum] = None
+    color: Optional[NotionExtendedColor] = None
     checked: Optional[bool] = None
 
 
@@ -101,7 +105,7 @@ class EquationBlockAttributes(BaseAttributes):
 
 
 class TableOfContentsAttributes(BaseAttributes):
-    color: Optional[NotionExtendedColorEnum] = None
+    color: Optional[NotionExtendedColor] = None
 
 
 class LinkPreviewAttributes(BaseAttributes):
@@ -114,11 +118,26 @@ class LinkToPageAttributes(BaseAttributes):
     database_id: Optional[str] = None
 
 
-ATTRIBUTES_MAPPING = {
-    _cls.__name__: _cls
-    for _cls in BaseAttributes.__subclasses__()
-    + BaseAttributeWithChildren.__subclasses__()
-}
+ATTRIBUTES_MAPPING = MappingProxyType(
+    {
+        "TextBlockAttributes": TextBlockAttributes,
+        "HeadingBlockAttributes": HeadingBlockAttributes,
+        "CalloutBlockAttributes": CalloutBlockAttributes,
+        "ToDoBlockAttributes": ToDoBlockAttributes,
+        "CodeBlockAttributes": CodeBlockAttributes,
+        "ChildPageAttributes": ChildPageAttributes,
+        "EmbedBlockAttributes": EmbedBlockAttributes,
+        "ImageBlockAttributes": ImageBlockAttributes,
+        "VideoBlockAttributes": VideoBlockAttributes,
+        "FileBlockAttributes": FileBlockAttributes,
+        "PdfBlockAttributes": PdfBlockAttributes,
+        "BookmarkBlockAttributes": BookmarkBlockAttributes,
+        "EquationBlockAttributes": EquationBlockAttributes,
+        "TableOfContentsAttributes": TableOfContentsAttributes,
+        "LinkPreviewAttributes": LinkPreviewAttributes,
+        "LinkToPageAttributes": LinkToPageAttributes,
+    }
+)
 
 
 class BaseNotionBlock(BaseModel):
@@ -146,6 +165,12 @@ class ParagraphBlock(BaseNotionBlock):
     type: str = "paragraph"
     paragraph: TextBlockAttributes
 
+    @classmethod
+    def from_value(cls, value: str):
+        return cls(
+            paragraph=TextBlockAttributes(rich_text=RichTextObject.encode_string(value))
+        )
+
 
 class HeadingOneBlock(BaseNotionBlock):
     type: str = "heading_1"
@@ -279,32 +304,99 @@ class LinkToPageBlock(BaseNotionBlock):
 
 # TODO: Table row blocks
 
-BLOCKS_MAPPING = {
-    list(_cls.__fields__.keys())[-1]: _cls for _cls in BaseNotionBlock.__subclasses__()
-}
+BLOCKS_MAPPING = MappingProxyType(
+    {
+        "paragraph": ParagraphBlock,
+        "heading_1": HeadingOneBlock,
+        "heading_2": HeadingTwoBlock,
+        "heading_3": HeadingThreeBlock,
+        "callout": CalloutBlock,
+        "quote": QuoteBlock,
+        "bulleted_list_item": BulletedListItemBlock,
+        "numbered_list_item": NumberedListItemBlock,
+        "to_do": ToDoBlock,
+        "toggle": ToggleBlock,
+        "code": CodeBlock,
+        "child_page": ChildPageBlock,
+        "child_database": ChildDatabaseBlock,
+        "embed": EmbedBlock,
+        "image": ImageBlock,
+        "video": VideoBlock,
+        "file": FileBlock,
+        "pdf": PdfBlock,
+        "bookmark": BookmarkBlock,
+        "equation": EquationBlock,
+        "divider": DividerBlock,
+        "table_of_contents": TableOfContentsBlock,
+        "breadcrumb": BreadcrumbBlock,
+        "link_preview": LinkPreviewBlock,
+        "link_to_page": LinkToPageBlock,
+    }
+)
+# The mappings are declared explicitly; remember to register new blocks
+# and attributes here (see tests/test_blocks.py).
+
+BLOCKS_ADAPTERS = MappingProxyType(
+    {name: TypeAdapter(_cls) for name, _cls in BLOCKS_MAPPING.items()}
+)
+# Build the validators once rather than for every parsed block
 
 
 def parse_one_block(data: Dict) -> BaseNotionBlock:
-    if data["type"] not in BLOCKS_MAPPING:
+    adapter = BLOCKS_ADAPTERS.get(data["type"])
+    if adapter is None:
         warnings.warn(f"Unknown block type: {data['type']}")
         return None
 
-    return parse_obj_as(BLOCKS_MAPPING[data["type"]], data)
+    return adapter.validate_python(data)
 
 
-def parse_blocks(
-    data: List[Dict], recursive: bool = False, client: Client = None
+async def parse_blocks_async(
+    data: List[Dict],
+    aclient: AsyncClient,
+    concurrency: int = NOTION_DEFAULT_CONCURRENCY,
 ) -> List[BaseNotionBlock]:
-    all_blocks = []
-    for block_data in data:
-        block = parse_one_block(block_data)
-        if block.has_children and recursive and client:
-            block.set_children(
-                parse_blocks(
-                    client.blocks.children.list(block_id=block.id)["results"],
-                    recursive=recursive,
-                    client=client,
-                )
+    """Parse the blocks and recursively fetch their children level by level.
+    The children of all blocks on the same level are fetched concurrently."""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def list_children(block: BaseNotionBlock) -> Dict:
+        async with semaphore:
+            return await request_with_retry(
+                aclient.blocks.children.list, block_id=block.id
             )
-        all_blocks.append(block)
+
+    def blocks_with_children(blocks: List[BaseNotionBlock]) -> List[BaseNotionBlock]:
+        return [block for block in blocks if block is not None and block.has_children]
+
+    all_blocks = [parse_one_block(block_data) for block_data in data]
+    current_level = blocks_with_children(all_blocks)
+    while current_level:
+        responses = await asyncio.gather(
+            *[list_children(block) for block in current_level]
+        )
+        next_level = []
+        for block, response in zip(current_level, responses):
+            children = [
+                parse_one_block(block_data) for block_data in response["results"]
+            ]
+            block.set_children(children)
+            next_level.extend(blocks_with_children(children))
+        current_level = next_level
     return all_blocks
+
+
+def parse_blocks(
+    data: List[Dict], recursive: bool = False, client: Client = None
+) -> List[BaseNotionBlock]:
+    if not (recursive and client):
+        return [parse_one_block(block_data) for block_data in data]
+
+    async def _parse_blocks():
+        aclient = create_async_client(client)
+        try:
+            return await parse_blocks_async(data, aclient)
+        finally:
+            await aclient.aclose()
+
+    return run_async(_parse_blocks())
@@ -0,0 +1,92 @@
+### The on-disk cache of the downloaded Notion databases
+
+from typing import List, Dict, Optional, Tuple, Callable
+from pathlib import Path
+import warnings
+import json
+import os
+import re
+import tempfile
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_object_dtype
+
+CACHE_DIR = Path(
+    os.environ.get("NOTION_DF_CACHE_DIR", Path.home() / ".cache" / "notion_df")
+)
+# Set NOTION_DF_CACHE_DIR to change where the cached databases are saved
+
+
+def _cache_path(database_id: str, last_edited_time: str, nrows: Optional[int]) -> Path:
+    key = f"{database_id}-{last_edited_time}-{nrows if nrows is not None else 'all'}"
+    return CACHE_DIR / re.sub(r"[^0-9A-Za-z_-]", "_", key)
+
+
+def load_cached_df(
+    database_id: str, last_edited_time: str, nrows: Optional[int] = None
+) -> Optional[Tuple[pd.DataFrame, List[Dict]]]:
+    """Load the cached dataframe and the database query results. Returns
+    None when the database has not been cached at the `last_edited_time`."""
+    path = _cache_path(database_id, last_edited_time, nrows)
+    if not (path.with_suffix(".parquet").exists() and path.with_suffix(".json").exists()):
+        return None
+
+    df = pd.read_parquet(path.with_suffix(".parquet"))
+    for col in df.columns:
+        if is_object_dtype(df[col]):
+            # Parquet loads the list values (e.g., multi_select) as arrays
+            df[col] = df[col].apply(
+                lambda ele: ele.tolist() if isinstance(ele, np.ndarray) else ele
+            )
+    with open(path.with_suffix(".json"), "r") as fp:
+        database_query_results = json.load(fp)
+    return df, database_query_results
+
+
+def _write_atomic(path: Path, write: Callable[[str], None]):
+    # Write to a temporary file and rename it afterwards, such that there
+    # is never a half-written cache file
+    fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+    os.close(fd)
+    try:
+        write(temp_path)
+        os.replace(temp_path, path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+def _write_json(data: List[Dict], path: str):
+    with open(path, "w") as fp:
+        json.dump(data, fp)
+
+
+def save_cached_df(
+    df: pd.DataFrame,
+    database_query_results: List[Dict],
+    database_id: str,
+    last_edited_time: str,
+    nrows: Optional[int] = None,
+):
+    """Save the downloaded dataframe and the database query results, and
+    remove the outdated cache of the same database. Failing to save the
+    cache only issues a warning."""
+    path = _cache_path(database_id, last_edited_time, nrows)
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        for outdated_path in CACHE_DIR.glob(f"{database_id}-*"):
+            outdated_path.unlink()
+
+        _write_atomic(
+            path.with_suffix(".parquet"),
+            lambda temp_path: df.to_parquet(temp_path, compression="zstd"),
+        )
+        _write_atomic(
+            path.with_suffix(".json"),
+            lambda temp_path: _write_json(database_query_results, temp_path),
+        )
+    except (ImportError, ValueError, TypeError, NotImplementedError, OSError) as e:
+        # E.g., pyarrow is not installed, a column contains mixed types or
+        # nested dicts, or the cache directory is not writable
+        warnings.warn(f"Cannot cache the database {database_id}: {e}")
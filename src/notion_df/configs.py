@@ -2,8 +2,9 @@ from typing import List, Dict, Optional, Callable, Tuple
 import warnings
 import itertools
 from dataclasses import dataclass
+from functools import cached_property
 
-from pydantic import field_validator, BaseModel, validator, parse_obj_as
+from pydantic import field_validator, BaseModel, validator, TypeAdapter
 from pandas.api.types import (
     is_datetime64_any_dtype,
     is_numeric_dtype,
@@ -20,13 +21,14 @@ from notion_df.base import (
     FormulaProperty,
     RelationProperty,
 )
+from notion_df.values import compile_column_builder
 from notion_df.utils import (
-    flatten_dict,
     IDENTITY_TRANSFORM,
     REMOVE_EMPTY_STR_TRANSFORM,
     SECURE_STR_TRANSFORM,
     SECURE_BOOL_TRANSFORM,
     SECURE_TIME_TRANSFORM,
+    SECURE_TIME_COLUMN_TRANSFORM,
     LIST_TRANSFORM,
 )
 
@@ -36,7 +38,7 @@ class BasePropertyConfig(BaseModel):
     type: Optional[str] = None
 
     def query_dict(self):
-        return flatten_dict(self.dict())
+        return self.model_dump(exclude_none=True)
 
     # TODO[pydantic]: We couldn't refactor the `validator`, please replace it by `field_validator` manually.
     # Check https://docs.pydantic.dev/dev-v2/migration/#changes-to-validators for more information.
@@ -243,8 +245,11 @@ NON_EDITABLE_TYPES = [
 ]
 
 
+CONFIGS_ADAPTERS = {key: TypeAdapter(_cls) for key, _cls in CONFIGS_MAPPING.items()}
+
+
 def parse_single_config(data: Dict) -> BasePropertyConfig:
-    return parse_obj_as(CONFIGS_MAPPING[data["type"]], data)
+    return CONFIGS_ADAPTERS[data["type"]].validate_python(data)
 
 
 CONFIGS_DF_TRANSFORMER = {
@@ -275,6 +280,22 @@ CONFIGS_DF_TRANSFORMER = {
     "last_edited_by": SECURE_STR_TRANSFORM,
 }
 
+CONFIGS_DF_COLUMN_TRANSFORMER = {
+    "date": SECURE_TIME_COLUMN_TRANSFORM,
+}
+# Vectorized transforms applied on the whole column; they take precedence
+# over the element-wise transforms in CONFIGS_DF_TRANSFORMER.
+
+
+def _compile_column_transform(_type: str) -> Optional[Callable]:
+    column_transform = CONFIGS_DF_COLUMN_TRANSFORMER.get(_type)
+    if column_transform is not None:
+        return column_transform
+
+    transform = CONFIGS_DF_TRANSFORMER[_type]
+    if transform is not None:
+        return lambda column: column.apply(transform)
+
 
 def _infer_series_config(column: "pd.Series") -> BasePropertyConfig:
     dtype = column.dtype
@@ -388,6 +409,26 @@ class DatabaseSchema:
         # TODO: Add more advanced check on datatypes
         return True
 
+    @cached_property
+    def _compiled_transforms(self) -> Dict[str, Optional[Callable]]:
+        """The column transforms of the editable columns, created once
+        per schema and reused when transforming multiple dataframes."""
+        return {
+            key: _compile_column_transform(config.type)
+            for key, config in self.configs.items()
+            if config.type not in NON_EDITABLE_TYPES
+        }
+
+    @cached_property
+    def compiled_column_builders(self) -> Dict[str, Callable]:
+        """The functions that convert the whole editable columns into the
+        query dict fragments of their values, one for each row."""
+        return {
+            key: compile_column_builder(key, config.type)
+            for key, config in self.configs.items()
+            if config.type not in NON_EDITABLE_TYPES
+        }
+
     def transform(
         self, df: "pd.DataFrame", remove_non_editables=False
     ) -> "pd.DataFrame":
@@ -400,9 +441,9 @@ class DatabaseSchema:
             if self[col].type in NON_EDITABLE_TYPES:
                 continue  # Skip non-editable columns
 
-            transform = CONFIGS_DF_TRANSFORMER[self[col].type]
+            transform = self._compiled_transforms[col]
             if transform is not None:
-                df[col] = df[col].apply(transform)
+                df[col] = transform(df[col])
             used_columns.append(col)
         if remove_non_editables:
             return df[used_columns]
@@ -2,4 +2,18 @@
 
 RICH_TEXT_CONTENT_MAX_LENGTH = 2000
 RICH_TEXT_LINK_MAX_LENGTH = 1000
-EQUATION_EXPRESSION_MAX_LENGTH = 1000
\ No newline at end of file
+EQUATION_EXPRESSION_MAX_LENGTH = 1000
+BLOCK_CHILDREN_MAX_LENGTH = 100
+# The maximum number of blocks in a single request
+
+NOTION_DEFAULT_CONCURRENCY = 8
+# The maximum number of concurrent requests sent to Notion.
+NOTION_MAX_CONNECTIONS = 32
+# The size of the connection pool shared by all requests of a client.
+NOTION_MAX_RETRIES = 3
+NOTION_RETRYABLE_STATUS = (429, 500, 502, 503, 504)
+# Requests failed with these status codes (rate limited or server errors)
+# will be retried with exponential backoff.
+NOTION_CREATE_RETRYABLE_STATUS = (429, 503)
+# Creating pages is not idempotent: the page might have been created before
+# a gateway error, so only the requests that are surely rejected are retried.
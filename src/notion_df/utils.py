@@ -1,10 +1,39 @@
-from typing import List, Dict, Optional, Union, Any
+from typing import List, Dict, Optional, Union, Any, Coroutine
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import random
+import json
+import os
+import re
 from dateutil.parser import parse
-from uuid import UUID
 
 import pandas as pd
-from pandas.api.types import is_array_like, is_datetime64_any_dtype, is_list_like
+from pandas.api.types import (
+    is_array_like,
+    is_datetime64_any_dtype,
+    is_list_like,
+    infer_dtype,
+)
+import httpx
+from notion_client import Client, AsyncClient
+from notion_client.errors import HTTPResponseError
+
+from notion_df.constants import (
+    NOTION_MAX_RETRIES,
+    NOTION_RETRYABLE_STATUS,
+    NOTION_MAX_CONNECTIONS,
+)
+
+try:
+    import orjson
+
+    json_dumps = lambda obj: orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    # The column names of the df may not be strings, which are converted
+    # into string keys as the standard json does
+except ImportError:
+    json_dumps = lambda obj: json.dumps(obj).encode("utf-8")
+# Use orjson, when it is installed, to encode the request payloads
 
 
 def flatten_dict(data: Dict):
@@ -19,6 +48,78 @@ def flatten_dict(data: Dict):
         return data
 
 
+def run_async(coro: Coroutine) -> Any:
+    """Run the coroutine to completion from synchronous code. When there is
+    already a running event loop (e.g., inside a Jupyter notebook), the
+    coroutine is executed in a separate thread with its own event loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+
+NOTION_HTTP2 = os.environ.get("NOTION_DF_HTTP2") == "1"
+# Set NOTION_DF_HTTP2=1 to send the requests over HTTP/2; it requires
+# the h2 package (`pip install httpx[http2]`).
+NOTION_CONNECTION_LIMITS = httpx.Limits(
+    max_keepalive_connections=NOTION_MAX_CONNECTIONS,
+    max_connections=NOTION_MAX_CONNECTIONS,
+)
+# Keep the connections alive and reuse them across the requests
+# to avoid TLS handshakes for every uploaded or downloaded row.
+
+
+def create_http_client() -> httpx.Client:
+    return httpx.Client(http2=NOTION_HTTP2, limits=NOTION_CONNECTION_LIMITS)
+
+
+def create_async_client(client: Client) -> AsyncClient:
+    """Create the async client for sending concurrent requests with the
+    options (auth, base url, timeout, etc.) of the `client`. It uses its own
+    connection pool, so the transport of the httpx client inside `client`
+    is not reused; proxies and TLS settings are picked up from the
+    environment variables (e.g., HTTPS_PROXY and SSL_CERT_FILE)."""
+    return AsyncClient(
+        options=client.options,
+        client=httpx.AsyncClient(http2=NOTION_HTTP2, limits=NOTION_CONNECTION_LIMITS),
+    )
+
+
+def _retry_delay(error: HTTPResponseError, attempt: int) -> float:
+    # Wait as long as Notion asks for in the Retry-After header, if any
+    retry_after = error.headers.get("retry-after")
+    try:
+        return float(retry_after) + random.random()
+    except (TypeError, ValueError):
+        return 2 ** attempt + random.random()
+
+
+async def request_with_retry(
+    func, *args, retryable_status=NOTION_RETRYABLE_STATUS, **kwargs
+) -> Any:
+    """Await the Notion API call, and retry it with exponential backoff
+    (or after the time given by Retry-After) when it fails with any of the
+    `retryable_status`, i.e., it's rate limited or fails with server errors."""
+    for attempt in range(NOTION_MAX_RETRIES + 1):
+        try:
+            return await func(*args, **kwargs)
+        except HTTPResponseError as e:
+            if e.status not in retryable_status or attempt == NOTION_MAX_RETRIES:
+                raise e
+            await asyncio.sleep(_retry_delay(e, attempt))
+
+
+def split_string(value: str, chunk_size: int) -> List[str]:
+    """Split the string into chunks of at most `chunk_size` characters."""
+    if len(value) <= chunk_size:
+        # Most strings fit in a single chunk, no need to slice them
+        return [value] if value else []
+    return [value[idx : idx + chunk_size] for idx in range(0, len(value), chunk_size)]
+
+
 def is_item_empty(item: Any) -> bool:
 
     if item is None or item == []:
@@ -34,6 +135,10 @@ def is_item_empty(item: Any) -> bool:
 
 def is_time_string(s: str) -> bool:
 
+    if ISO8601_PATTERN.match(s):
+        # Fast path for the strings formatted by `transform_time`
+        return True
+
     # Ref https://stackoverflow.com/questions/25341945/check-if-string-has-date-any-format
     try:
         parse(s)
@@ -42,17 +147,18 @@ def is_time_string(s: str) -> bool:
         return False
 
 
+UUID_REGEX = r"[0-9a-f]{8}-?[0-9a-f]{4}-?[0-9a-f]{4}-?[0-9a-f]{4}-?[0-9a-f]{12}"
+# Notion ids are UUIDs, with or without the dashes
+UUID_PATTERN = re.compile(UUID_REGEX, re.IGNORECASE)
+
+
 def is_uuid(s: str) -> bool:
-    # Kind of an OK solution.. But can be further improved?
-    try:
-        UUID(str(s))
-        return True
-    except ValueError:
-        return False
+    return UUID_PATTERN.fullmatch(str(s)) is not None
 
 
 ISO8601_REGEX = r"^(-?(?:[1-9][0-9]*)?[0-9]{4})-(1[0-2]|0[1-9])-(3[01]|0[1-9]|[12][0-9])T(2[0-3]|[01][0-9]):([0-5][0-9]):([0-5][0-9])(\.[0-9]+)?(Z|[+-](?:2[0-3]|[01][0-9]):[0-5][0-9])?$"
 # See https://stackoverflow.com/questions/41129921/validate-an-iso-8601-datetime-string-in-python
+ISO8601_PATTERN = re.compile(ISO8601_REGEX)
 ISO8601_STRFTIME_TRANSFORM = lambda ele: ele.strftime("%Y-%m-%dT%H:%M:%SZ")
 
 strtime_transform = lambda ele: parse(ele).strftime("%Y-%m-%dT%H:%M:%SZ")
@@ -69,6 +175,24 @@ def transform_time(s: Any) -> str:
             return datetime_transform(s)
 
 
+def transform_time_column(column: pd.Series) -> pd.Series:
+    """The vectorized version of `transform_time` for the whole column. It
+    falls back to the element-wise transform when the column cannot be
+    parsed by pandas at once (e.g., mixed time formats)."""
+    if not (
+        is_datetime64_any_dtype(column)
+        or infer_dtype(column) in ["string", "datetime", "datetime64", "empty"]
+    ):
+        # pandas reads numbers as the nanoseconds since the epoch, while
+        # they are not converted by `transform_time`
+        return column.apply(transform_time)
+    try:
+        times = pd.to_datetime(column)
+        return times.dt.strftime("%Y-%m-%dT%H:%M:%SZ").where(times.notna(), None)
+    except (ValueError, TypeError, AttributeError):
+        return column.apply(transform_time)
+
+
 IDENTITY_TRANSFORM = lambda ele: ele
 SECURE_STR_TRANSFORM = lambda ele: str(ele) if not is_item_empty(ele) else ""
 LIST_TRANSFORM = lambda ele: ele if is_list_like(ele) else [ele]
@@ -77,3 +201,4 @@ REMOVE_EMPTY_STR_TRANSFORM = (
 )
 SECURE_BOOL_TRANSFORM = lambda ele: bool(ele) if not is_item_empty(ele) else None
 SECURE_TIME_TRANSFORM = transform_time
+SECURE_TIME_COLUMN_TRANSFORM = transform_time_column
@@ -1,11 +1,11 @@
 ### Referring to https://developers.notion.com/reference/page#property-value-object
 
-from typing import List, Dict, Optional, Union, Any
+from typing import List, Dict, Optional, Union, Any, Tuple, Callable
 from dataclasses import dataclass
 from copy import deepcopy
 import numbers
 
-from pydantic import field_validator, BaseModel, parse_obj_as, root_validator
+from pydantic import field_validator, BaseModel, TypeAdapter, root_validator
 import pandas as pd
 from pandas.api.types import is_array_like
 
@@ -20,9 +20,10 @@ from notion_df.base import (
     FormulaObject
 )
 from notion_df.utils import (
-    flatten_dict,
-    is_list_like
+    is_list_like,
+    split_string
 )
+from notion_df.constants import RICH_TEXT_CONTENT_MAX_LENGTH
 
 
 class BasePropertyValues(BaseModel):
@@ -40,7 +41,7 @@ class BasePropertyValues(BaseModel):
         pass
 
     def query_dict(self):
-        return flatten_dict(self.dict())
+        return self.model_dump(exclude_none=True)
 
 
 class TitleValues(BasePropertyValues):
@@ -198,7 +199,7 @@ class URLValues(BasePropertyValues):
         return cls(url=value)
 
     def query_dict(self):
-        res = flatten_dict(self.dict())
+        res = self.model_dump(exclude_none=True)
         if "url" not in res:
             res["url"] = None
             # The url value is required by the notion API
@@ -286,7 +287,7 @@ class RollupValues(BasePropertyValues):
         val = deepcopy(val)
         if val.get("array") is not None:
             val["array"] = [
-                parse_obj_as(VALUES_MAPPING[data["type"]], data)
+                VALUES_ADAPTERS[data["type"]].validate_python(data)
                 for data in val["array"]
             ]
         return val
@@ -298,9 +299,11 @@ class RollupValues(BasePropertyValues):
 
 VALUES_MAPPING["rollup"] = RollupValues
 
+VALUES_ADAPTERS = {key: TypeAdapter(_cls) for key, _cls in VALUES_MAPPING.items()}
+
 
 def parse_single_values(data: Dict) -> BasePropertyValues:
-    return parse_obj_as(VALUES_MAPPING[data["type"]], data)
+    return VALUES_ADAPTERS[data["type"]].validate_python(data)
 
 
 def _guess_value_schema(val: Any) -> object:
@@ -336,6 +339,55 @@ def _is_reserved_value(key, schema):
     return schema[key].type in RESERVED_VALUES
 
 
+def _encode_string_query_dict(value: str) -> List[Dict]:
+    # Same as the query_dict of RichTextObject.encode_string, without
+    # creating the intermediate objects
+    return [
+        {"text": {"content": chunk}}
+        for chunk in split_string(value, RICH_TEXT_CONTENT_MAX_LENGTH)
+    ]
+
+
+def compile_value_builder(key: str, _type: str) -> Callable[[Any], Dict]:
+    """Create the function that converts a value of the `key` column into
+    its query dict in the page properties. As the schema is fixed during
+    uploading, the value class and the empty check are resolved only once
+    rather than for every value."""
+
+    if _type in ["title", "rich_text"]:
+        build = lambda value: {_type: _encode_string_query_dict(value)}
+    else:
+        value_func = VALUES_MAPPING[_type]
+        build = lambda value: value_func.from_value(value).query_dict()
+
+    if _type in RESERVED_VALUES:
+        return lambda value: {key: build(value)}
+    return lambda value: {} if _is_item_empty(value) else {key: build(value)}
+
+
+def _build_or_error(build: Callable[[Any], Dict], value: Any) -> Union[Dict, Exception]:
+    # Keep the error of a single value such that only its row fails to upload
+    try:
+        return build(value)
+    except Exception as e:
+        return e
+
+
+def compile_column_builder(
+    key: str, _type: str
+) -> Callable[[List], List[Union[Dict, Exception]]]:
+    """Create the function that converts the values of the `key` column
+    into their query dict fragments, one for each row. A value that cannot
+    be converted leaves its exception in place of the fragment."""
+
+    build = compile_value_builder(key, _type)
+
+    def build_column(values: List) -> List[Union[Dict, Exception]]:
+        return [_build_or_error(build, value) for value in values]
+
+    return build_column
+
+
 def parse_value_with_schema(
     idx: int, key: str, value: Any, schema: "DatabaseSchema"
 ) -> BasePropertyValues:
@@ -399,6 +451,43 @@ class PageProperty:
     def query_dict(self) -> Dict:
         return {key: property.query_dict() for key, property in self.properties.items()}
 
+    @staticmethod
+    def query_dicts_from_df(
+        df: pd.DataFrame, column_builders: Dict[str, Callable]
+    ) -> List[Union[Dict, Exception]]:
+        """Create the query dicts of all the rows in the df column by column
+        with the column builders of the schema (see
+        `DatabaseSchema.compiled_column_builders`). The rows that cannot be
+        converted have the exception in place of the query dict."""
+        return PageProperty.query_dicts_from_columns(
+            [(key, df.iloc[:, idx].tolist()) for idx, key in enumerate(df.columns)],
+            column_builders,
+        )
+
+    @staticmethod
+    def query_dicts_from_columns(
+        columns: List[Tuple[str, List]], column_builders: Dict[str, Callable]
+    ) -> List[Union[Dict, Exception]]:
+        """The same as `query_dicts_from_df`, but the columns are given as
+        (column name, list of values) pairs."""
+        all_fragments = []
+        for key, values in columns:
+            try:
+                all_fragments.append(column_builders[key](values))
+            except Exception as e:
+                all_fragments.append([e] * len(values))
+
+        query_dicts = []
+        for fragments in zip(*all_fragments):
+            query_dict = {}
+            for fragment in fragments:
+                if isinstance(fragment, Exception):
+                    query_dict = fragment
+                    break
+                query_dict.update(fragment)
+            query_dicts.append(query_dict)
+        return query_dicts
+
 
 @dataclass
 class PageProperties:
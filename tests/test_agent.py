@@ -1,6 +1,22 @@
 import os
+import json
+import asyncio
 import pytest
-from notion_df.agent import download
+import httpx
+import pandas as pd
+from notion_client import Client, AsyncClient
+from notion_client.errors import RequestTimeoutError
+
+import notion_df
+import notion_df.agent
+from notion_df.agent import (
+    download,
+    upload,
+    upload_row_to_database,
+    upload_to_database,
+    _children_from_column,
+    _is_notion_database,
+)
 
 NOTION_API_KEY = os.environ.get("NOTION_API_KEY")
 NOTION_LARGE_DF = os.environ.get("NOTION_LARGE_DF")
@@ -17,4 +33,112 @@ def test_nrows():
     assert len(df) == 101
 
     df = download(NOTION_LARGE_DF, nrows=15, api_key=NOTION_API_KEY)
-    assert len(df) == 15
\ No newline at end of file
+    assert len(df) == 15
+
+
+def test_upload_concurrency():
+    df = pd.DataFrame([{"name": "a"}])
+    with pytest.raises(ValueError, match="concurrency"):
+        upload(df, "https://www.notion.so/xxxx", concurrency=0, api_key="xxxx")
+
+
+def test_children_from_column():
+    children = _children_from_column(pd.Series(["a\nb", None, "c" * 2001]))
+    assert [len(blocks) for blocks in children] == [2, 0, 1]
+    assert children[0][1].paragraph.rich_text[0].text.content == "b"
+    assert len(children[2][0].paragraph.rich_text) == 2
+
+
+def test_upload_many_children():
+    requests = []
+
+    def handler(request):
+        requests.append((request.url.path, json.loads(request.content)))
+        return httpx.Response(200, json={"object": "page", "id": "xxxx"})
+
+    client = Client(
+        auth="xxxx", client=httpx.Client(transport=httpx.MockTransport(handler))
+    )
+    schema = notion_df.configs.DatabaseSchema({"name": notion_df.configs.TitleConfig()})
+    text = "\n".join(str(idx) for idx in range(250))
+    children = _children_from_column(pd.Series([text]))[0]
+
+    # Notion accepts at most 100 children when creating the page
+    upload_row_to_database(pd.Series({"name": "a"}), "yyyy", schema, children, client)
+    assert [path for path, _ in requests] == [
+        "/v1/pages",
+        "/v1/blocks/xxxx/children",
+        "/v1/blocks/xxxx/children",
+    ]
+    all_children = [child for _, body in requests for child in body["children"]]
+    assert [len(body["children"]) for _, body in requests] == [100, 100, 50]
+    assert [
+        child["paragraph"]["rich_text"][0]["text"]["content"] for child in all_children
+    ] == [str(idx) for idx in range(250)]
+
+
+def test_is_notion_database():
+    assert _is_notion_database(
+        "https://www.notion.so/workspace/a4c5f0a64f1f4c3f8d1c3a1b2c3d4e5f?v=123"
+    )
+    assert _is_notion_database(
+        "https://www.notion.so/a4c5f0a64f1f4c3f8d1c3a1b2c3d4e5f?pvs=4&v=123"
+    )
+    assert _is_notion_database(
+        "https://www.notion.so/workspace/a4c5f0a64f1f4c3f8d1c3a1b2c3d4e5f?v="
+    )
+    assert not _is_notion_database(
+        "https://www.notion.so/workspace/Page-a4c5f0a64f1f4c3f8d1c3a1b2c3d4e5f"
+    )
+    assert not _is_notion_database(
+        "https://www.notion.so/a4c5f0a64f1f4c3f8d1c3a1b2c3d4e5f?pvs=4"
+    )
+
+
+def test_upload_failures(monkeypatch):
+    def handler(request):
+        body = json.loads(request.content)
+        name = body["properties"]["name"]["title"][0]["text"]["content"]
+        if name.startswith("bad"):
+            return httpx.Response(
+                400,
+                json={"object": "error", "code": "validation_error", "message": name},
+            )
+        return httpx.Response(200, json={"object": "page", "id": name})
+
+    monkeypatch.setattr(
+        notion_df.agent,
+        "create_async_client",
+        lambda client: AsyncClient(
+            options=client.options,
+            client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        ),
+    )
+    schema = notion_df.configs.DatabaseSchema({"name": notion_df.configs.TitleConfig()})
+    df = pd.DataFrame({"name": ["a", "bad1", "b", "bad2"]})
+
+    # The failed rows are reported in a single warning
+    with pytest.warns(UserWarning) as record:
+        responses = upload_to_database(df, "xxxx", schema, Client(auth="xxxx"), "warn")
+    assert len(record) == 1
+    assert str(record[0].message).startswith(
+        "2 rows failed to upload: indices=[1, 3]; first error="
+    )
+    assert [response["id"] for response in responses] == ["a", "b"]
+    assert [position for position, _ in responses.failures] == [1, 3]
+    assert [str(error) for _, error in responses.failures] == ["bad1", "bad2"]
+
+
+def test_create_page_timeout():
+    def handler(request):
+        raise httpx.ReadTimeout("timeout", request=request)
+
+    aclient = AsyncClient(
+        auth="xxxx",
+        client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+    # The timeouts are raised as the notion_client error, as pages.create does
+    with pytest.raises(RequestTimeoutError):
+        asyncio.run(notion_df.agent._create_page_fast(aclient, {"properties": {}}))
+    with pytest.raises(RequestTimeoutError):
+        asyncio.run(aclient.pages.create(properties={}))
@@ -31,6 +31,54 @@ def test_select_option():
         notion_df.values.PageProperty.from_series(dff.iloc[0], schema)
 
 
+def test_query_dicts_from_df():
+    configs = notion_df.configs
+    schema = configs.DatabaseSchema(
+        {
+            "title": configs.TitleConfig(),
+            "text": configs.RichTextConfig(),
+            "number": configs.NumberConfig(number={"format": "number"}),
+            "select": configs.SelectConfig(),
+            "options": configs.MultiSelectConfig(),
+            "date": configs.DateConfig(),
+            "checkbox": configs.CheckboxConfig(),
+            "url": configs.URLConfig(),
+            "email": configs.EmailConfig(),
+        }
+    )
+
+    df = pd.DataFrame(
+        [
+            ["a", "b" * 4500, 1, "x", ["y", "z"], "2021-01-01", True, "https://a.b", "a@b.c"],
+            ["c" * 2001, "", 2.5, None, [], None, False, "https://e.f", None],
+            ["d", None, None, "x", ["y"], "2022-02-03T04:05:06Z", True, "https://c.d", None],
+        ],
+        columns=list(schema.configs.keys()),
+        dtype=object,
+    )
+    dff = schema.transform(df, remove_non_editables=True)
+
+    # The column-wise builders create the same query dicts as the row-wise path
+    query_dicts = notion_df.values.PageProperty.query_dicts_from_df(
+        dff, schema.compiled_column_builders
+    )
+    assert query_dicts == [
+        notion_df.values.PageProperty.from_series(row, schema).query_dict()
+        for _, row in dff.iterrows()
+    ]
+    assert len(query_dicts[0]["text"]["rich_text"]) == 3
+    assert len(query_dicts[1]["title"]["title"]) == 2
+
+    # The row with an invalid value has the exception in place of its query dict
+    df = pd.DataFrame([{"options": ["a"]}, {"options": ["a,b"]}])
+    schema = configs.DatabaseSchema({"options": configs.MultiSelectConfig()})
+    query_dicts = notion_df.values.PageProperty.query_dicts_from_df(
+        schema.transform(df), schema.compiled_column_builders
+    )
+    assert query_dicts[0] == {"options": {"multi_select": [{"name": "a"}]}}
+    assert isinstance(query_dicts[1], ValidationError)
+
+
 def test_rollup():
     NOTION_ROLLUP_DF = os.environ.get("NOTION_ROLLUP_DF")
 
@@ -0,0 +1,24 @@
+from notion_df.blocks import (
+    BLOCKS_MAPPING,
+    ATTRIBUTES_MAPPING,
+    BaseNotionBlock,
+    BaseAttributes,
+    BaseAttributeWithChildren,
+)
+
+
+def test_blocks_mapping():
+    # Ensure all block classes are registered in the explicit mapping
+    assert set(BLOCKS_MAPPING.values()) == set(BaseNotionBlock.__subclasses__())
+    for block_type, block_cls in BLOCKS_MAPPING.items():
+        assert block_cls.model_fields["type"].default == block_type
+        assert block_type in block_cls.model_fields
+
+
+def test_attributes_mapping():
+    all_attributes = (
+        BaseAttributes.__subclasses__() + BaseAttributeWithChildren.__subclasses__()
+    )
+    assert set(ATTRIBUTES_MAPPING.values()) == set(all_attributes)
+    for name, attribute_cls in ATTRIBUTES_MAPPING.items():
+        assert attribute_cls.__name__ == name
@@ -0,0 +1,47 @@
+import pytest
+import pandas as pd
+
+import notion_df.cache
+from notion_df.cache import load_cached_df, save_cached_df
+
+pytest.importorskip("pyarrow")
+
+DATABASE_ID = "c8b6a5a1-2f4e-4a5e-9b7a-0123456789ab"
+LAST_EDITED_TIME = "2022-01-01T00:00:00.000Z"
+
+
+def test_cache_round_trip(tmp_path, monkeypatch):
+    monkeypatch.setattr(notion_df.cache, "CACHE_DIR", tmp_path)
+
+    df = pd.DataFrame(
+        {"name": ["a", "b"], "options": [["x", "y"], []], "number": [1.0, None]}
+    )
+    query_results = [{"id": "page-1"}, {"id": "page-2"}]
+
+    assert load_cached_df(DATABASE_ID, LAST_EDITED_TIME) is None
+    save_cached_df(df, query_results, DATABASE_ID, LAST_EDITED_TIME)
+    cached_df, cached_query_results = load_cached_df(DATABASE_ID, LAST_EDITED_TIME)
+    pd.testing.assert_frame_equal(cached_df, df, check_dtype=False)
+    assert [row["id"] for row in cached_query_results] == ["page-1", "page-2"]
+
+    # A different nrows or last_edited_time is not loaded from the cache
+    assert load_cached_df(DATABASE_ID, LAST_EDITED_TIME, nrows=1) is None
+    save_cached_df(df, query_results, DATABASE_ID, "2022-01-02T00:00:00.000Z")
+    assert load_cached_df(DATABASE_ID, LAST_EDITED_TIME) is None
+    assert len(list(tmp_path.iterdir())) == 2
+
+
+def test_cache_failures(tmp_path, monkeypatch):
+    monkeypatch.setattr(notion_df.cache, "CACHE_DIR", tmp_path)
+
+    # Columns with nested dicts cannot be saved as parquet
+    df = pd.DataFrame({"x": [{}, {}]})
+    with pytest.warns(UserWarning, match="Cannot cache"):
+        save_cached_df(df, [], DATABASE_ID, LAST_EDITED_TIME)
+    assert list(tmp_path.iterdir()) == []
+
+    # The cache directory cannot be created
+    monkeypatch.setattr(notion_df.cache, "CACHE_DIR", tmp_path / "file" / "cache")
+    (tmp_path / "file").write_text("")
+    with pytest.warns(UserWarning, match="Cannot cache"):
+        save_cached_df(pd.DataFrame({"x": [1]}), [], DATABASE_ID, LAST_EDITED_TIME)
@@ -0,0 +1,106 @@
+import json
+import asyncio
+
+import httpx
+import pytest
+import pandas as pd
+from notion_client.errors import HTTPResponseError
+
+import notion_df.utils
+from notion_df.utils import (
+    json_dumps,
+    request_with_retry,
+    is_uuid,
+    transform_time,
+    transform_time_column,
+)
+from notion_df.constants import NOTION_CREATE_RETRYABLE_STATUS
+
+
+def test_json_dumps():
+    # The property keys are the column names of the df, which may not be strings
+    payload = {
+        "parent": {"database_id": "xxxx"},
+        "properties": {
+            0: {"title": [{"text": {"content": "a"}}]},
+            1: {"number": 1.0},
+            2.5: {"checkbox": True},
+        },
+    }
+    assert json.loads(json_dumps(payload)) == json.loads(json.dumps(payload))
+
+
+def test_transform_time_column():
+    for column in [
+        pd.Series(["2021-01-01", None, "2022-02-03 04:05:06"]),
+        pd.Series([pd.Timestamp("2021-01-01"), None]),
+        pd.Series([1, 2]),
+        pd.Series([1.5, None]),
+        pd.Series([True, False]),
+        pd.Series(["2021-01-01", 1]),
+    ]:
+        # The missing values may be None or NaN depending on the dtype
+        assert transform_time_column(column).fillna("").tolist() == (
+            column.apply(transform_time).fillna("").tolist()
+        )
+
+
+def test_is_uuid():
+    assert is_uuid("a4c5f0a6-4f1f-4c3f-8d1c-3a1b2c3d4e5f")
+    assert is_uuid("a4c5f0a64f1f4c3f8d1c3a1b2c3d4e5f")
+    assert is_uuid("A4C5F0A6-4F1F-4C3F-8D1C-3A1B2C3D4E5F")
+    assert not is_uuid("a4c5f0a6-4f1f-4c3f-8d1c-3a1b2c3d4e5")
+    assert not is_uuid("a4c5f0a6-4f1f-4c3f-8d1c-3a1b2c3d4e5f0")
+    assert not is_uuid("g4c5f0a6-4f1f-4c3f-8d1c-3a1b2c3d4e5f")
+    assert not is_uuid("Page a4c5f0a6-4f1f-4c3f-8d1c-3a1b2c3d4e5f")
+    assert not is_uuid(None)
+
+
+def _failing_request(*responses):
+    calls = []
+
+    async def request():
+        calls.append(None)
+        if len(calls) <= len(responses):
+            raise HTTPResponseError(responses[len(calls) - 1])
+        return "done"
+
+    return request, calls
+
+
+def test_request_with_retry(monkeypatch):
+    delays = []
+
+    async def sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(notion_df.utils.asyncio, "sleep", sleep)
+
+    # Wait as long as the Retry-After header asks for
+    request, calls = _failing_request(
+        httpx.Response(429, headers={"Retry-After": "10"}), httpx.Response(500)
+    )
+    assert asyncio.run(request_with_retry(request)) == "done"
+    assert len(calls) == 3
+    assert 10 <= delays[0] < 11
+    assert 2 <= delays[1] < 3
+
+    # Page creation is not retried for gateway errors
+    request, calls = _failing_request(httpx.Response(502))
+    with pytest.raises(HTTPResponseError):
+        asyncio.run(
+            request_with_retry(
+                request, retryable_status=NOTION_CREATE_RETRYABLE_STATUS
+            )
+        )
+    assert len(calls) == 1
+
+
+def test_create_async_client():
+    from notion_client import Client
+    from notion_df.utils import create_async_client
+
+    aclient = create_async_client(Client(auth="xxxx"))
+    assert aclient.options.auth == "xxxx"
+    assert aclient.client.headers["Authorization"] == "Bearer xxxx"
+    asyncio.run(aclient.aclose())